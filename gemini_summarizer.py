@@ -1,11 +1,12 @@
+import asyncio
 import os
 from typing import List, Dict, Optional
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from google import genai
 from google.genai import types
 from rich.console import Console
 from rich.prompt import Confirm
-import re
 from dotenv import load_dotenv
 from datetime import datetime
 
@@ -13,6 +14,20 @@ from datetime import datetime
 load_dotenv()
 
 
+@lru_cache(maxsize=None)
+def _read_prompt_file(filename: str) -> Optional[str]:
+    """Read a prompt file from this directory or its parent.
+
+    Cached so constructing a GeminiSummarizer more than once (e.g. per
+    category, or in tests) doesn't redo the stat calls and disk read."""
+    for base in (os.path.dirname(__file__), os.path.dirname(os.path.dirname(__file__))):
+        prompt_file = os.path.join(base, filename)
+        if os.path.exists(prompt_file):
+            with open(prompt_file, 'r') as f:
+                return f.read()
+    return None
+
+
 @dataclass
 class ArticleForSummary:
     title: str
@@ -22,14 +37,13 @@ class ArticleForSummary:
     published: str
     link: str
     
-    @property
+    @cached_property
     def word_count(self) -> int:
-        """Count words in title and content."""
-        text = f"{self.title} {self.content}"
-        # Simple word count: split by whitespace and filter empty strings
-        words = [w for w in re.split(r'\s+', text) if w]
-        return len(words)
-    
+        """Count words in title and content (computed once per article)."""
+        # str.split() with no argument splits on any whitespace run and
+        # drops empties - same result as the old regex, at C speed
+        return len(f"{self.title} {self.content}".split())
+
     @property
     def estimated_tokens(self) -> int:
         """Estimate token count as word count * 1.34."""
@@ -60,32 +74,18 @@ class GeminiSummarizer:
     
     def _load_prompt_template(self) -> str:
         """Load the prompt template from prompt_summarize.md file."""
-        prompt_file = os.path.join(os.path.dirname(__file__), 'prompt_summarize.md')
-        
-        if not os.path.exists(prompt_file):
-            # Try parent directory if not in same directory
-            prompt_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'prompt_summarize.md')
-        
-        if os.path.exists(prompt_file):
-            with open(prompt_file, 'r') as f:
-                return f.read()
-        else:
-            raise FileNotFoundError(f"Could not find prompt_summarize.md file. Looked in: {prompt_file}")
-    
+        template = _read_prompt_file('prompt_summarize.md')
+        if template is None:
+            raise FileNotFoundError("Could not find prompt_summarize.md file next to this script or in its parent directory.")
+        return template
+
     def _load_title_prompt_template(self) -> str:
         """Load the title generation prompt from prompt_generate-title.md file."""
-        prompt_file = os.path.join(os.path.dirname(__file__), 'prompt_generate-title.md')
-        
-        if not os.path.exists(prompt_file):
-            # Try parent directory if not in same directory
-            prompt_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'prompt_generate-title.md')
-        
-        if os.path.exists(prompt_file):
-            with open(prompt_file, 'r') as f:
-                return f.read()
-        else:
+        template = _read_prompt_file('prompt_generate-title.md')
+        if template is None:
             # Return default prompt if file not found
             return "Create a title from the most important development listed in the report that is no more than 10 words in length. Output only the title, nothing else."
+        return template
     
     def prepare_articles_for_summary(self, articles: List) -> List[ArticleForSummary]:
         """Convert articles to format suitable for summarization."""
@@ -124,21 +124,23 @@ class GeminiSummarizer:
     
     def create_prompt_with_articles(self, articles: List[ArticleForSummary]) -> str:
         """Create the full prompt by combining template with article data."""
-        # Start with the prompt template
-        prompt = self.prompt_template + "\n\n---\n\nARTICLES TO SUMMARIZE:\n\n"
-        
+        # Collect pieces in a list and join once at the end - appending
+        # to a shared string in a loop goes quadratic once the prompt is
+        # large, a single join is guaranteed linear
+        parts = [self.prompt_template, "\n\n---\n\nARTICLES TO SUMMARIZE:\n\n"]
+
         # Add article data
         for i, article in enumerate(articles, 1):
-            prompt += f"{i}. [{article.category}] {article.feed_title} ({article.published})\n"
-            prompt += f"   Title: {article.title}\n"
-            prompt += f"   URL: {article.link}\n"
+            parts.append(f"{i}. [{article.category}] {article.feed_title} ({article.published})\n")
+            parts.append(f"   Title: {article.title}\n")
+            parts.append(f"   URL: {article.link}\n")
             if article.content:
-                prompt += f"   Summary: {article.content}\n"
-            prompt += "\n"
-        
-        prompt += "\n---\n\nPlease provide the two-part summary as specified above."
-        
-        return prompt
+                parts.append(f"   Summary: {article.content}\n")
+            parts.append("\n")
+
+        parts.append("\n---\n\nPlease provide the two-part summary as specified above.")
+
+        return ''.join(parts)
     
     def summarize_articles(self, articles: List[ArticleForSummary]) -> str:
         """Summarize articles using Gemini with the loaded prompt template."""
@@ -206,6 +208,69 @@ class GeminiSummarizer:
         except Exception as e:
             raise Exception(f"Error calling Gemini API: {str(e)}")
     
+    async def _summarize_articles_async(self, articles: List[ArticleForSummary]) -> str:
+        """Async variant of summarize_articles, used for overlapping
+        several summarization jobs on one event loop."""
+        prompt = self.create_prompt_with_articles(articles)
+
+        contents = [
+            types.Content(
+                role="user",
+                parts=[
+                    types.Part.from_text(text=prompt),
+                ],
+            ),
+        ]
+
+        generate_content_config = types.GenerateContentConfig(
+            thinking_config=types.ThinkingConfig(
+                thinking_budget=-1,  # Extended thinking
+            ),
+            response_mime_type="text/plain",
+            candidate_count=1,
+            max_output_tokens=64000,
+        )
+
+        chunks = []
+        async for chunk in await self.client.aio.models.generate_content_stream(
+            model=self.model_name,
+            contents=contents,
+            config=generate_content_config,
+        ):
+            if chunk.text:
+                chunks.append(chunk.text)
+
+        full_response = ''.join(chunks)
+        if not full_response:
+            raise Exception("No response generated from Gemini API")
+        return full_response
+
+    def summarize_articles_batch(self, article_batches: List[List[ArticleForSummary]]) -> List[Optional[str]]:
+        """Summarize several article batches concurrently.
+
+        Each batch is one streamed Gemini call; gathering them on the
+        async client overlaps the network waits instead of paying the
+        full round trip per batch. Failed batches come back as None."""
+        if not article_batches:
+            return []
+
+        async def _run():
+            return await asyncio.gather(
+                *(self._summarize_articles_async(batch) for batch in article_batches),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(_run())
+
+        summaries = []
+        for result in results:
+            if isinstance(result, BaseException):
+                self.console.print(f"[red]Error calling Gemini API: {str(result)}[/red]")
+                summaries.append(None)
+            else:
+                summaries.append(result)
+        return summaries
+
     def interactive_summarize(self, articles: List, show_cost_estimate: bool = True) -> Optional[str]:
         """Interactive summarization with token count display and user confirmation."""
         if not articles:
@@ -270,8 +335,7 @@ class GeminiSummarizer:
     
     def estimate_tokens_for_prompt(self, prompt: str) -> int:
         """Estimate tokens for a given prompt string."""
-        words = [w for w in re.split(r'\s+', prompt) if w]
-        return int(len(words) * 1.34)
+        return int(len(prompt.split()) * 1.34)
     
     def generate_title(self, summary: str) -> str:
         """Generate a title for the summary using Gemini Flash-Lite."""
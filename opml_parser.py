@@ -1,13 +1,51 @@
-import xml.etree.ElementTree as ET
+try:
+    # lxml wraps libxml2, so parsing and serialization run at C speed;
+    # the stdlib tree is the fallback when it isn't installed
+    from lxml import etree as ET
+    _HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAVE_LXML = False
 from typing import Dict, List, Tuple, Set, Optional
+from copy import deepcopy
 from dataclasses import dataclass
-from datetime import datetime
+import io
 import os
 import shutil
-import re
+import sys
+import time
 
+# (epoch second, formatted string) for _timestamp's per-second memo
+_ts_cache = (0, '')
 
-@dataclass
+
+def _timestamp() -> str:
+    """Current time as YYYYMMDD_HHMMSS, memoized per second.
+
+    Calls within the same second share one formatted string, so a
+    parse -> remove -> manage pipeline stamps all its output files
+    consistently instead of formatting (and possibly colliding on)
+    separate datetime.now() reads."""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime('%Y%m%d_%H%M%S', time.localtime(now)))
+    return _ts_cache[1]
+
+
+def _extract_feed_ts(name: str) -> Optional[str]:
+    """Pull the YYYYMMDD_HHMMSS timestamp out of an all_feeds filename.
+
+    The name has a fixed layout (all_feeds_YYYYMMDD_HHMMSS.xml, 29 chars),
+    so a few slice checks beat a regex match; timestamps sort
+    lexicographically, so the raw string is enough for comparisons."""
+    if (len(name) == 29 and name.startswith('all_feeds_') and name.endswith('.xml')
+            and name[10:18].isdigit() and name[18] == '_' and name[19:25].isdigit()):
+        return name[10:25]
+    return None
+
+
+@dataclass(slots=True)
 class Feed:
     title: str
     xml_url: str
@@ -19,77 +57,223 @@ class OPMLParser:
     def __init__(self, opml_file: str):
         self.opml_file = opml_file
         self.feeds = []
-        self.categories = {}
+        self._categories = None
+        self._tree = None
+        self._data = None
+        # title/xmlUrl -> element and element -> parent, filled by parse();
+        # lets remove_feeds(mutate_in_place=True) delete elements directly
+        # instead of rescanning the tree
+        self._url_index = {}
+        self._parent_of = {}
+
+    @classmethod
+    def from_bytes(cls, data: bytes, source_hint: str = None) -> 'OPMLParser':
+        """Build a parser over OPML bytes already held in memory.
+
+        Saves the extra disk read when the document arrived over the
+        network or was just written by another step; source_hint only
+        labels the instance (used for default output filenames)."""
+        parser = cls(source_hint)
+        parser._data = data
+        return parser
+
+    def _source(self):
+        """What to hand the XML parser: in-memory bytes or the file path."""
+        if self._data is not None:
+            return io.BytesIO(self._data)
+        return self.opml_file
         
     def parse(self) -> Tuple[List[Feed], Dict[str, List[Feed]]]:
-        tree = ET.parse(self.opml_file)
-        root = tree.getroot()
-        body = root.find('body')
-        
-        self._parse_outline(body, None)
-        
+        # One streaming pass over the document: category outlines are
+        # pushed on a stack as they open and feeds are emitted as their
+        # elements appear, so no second walk is needed for category
+        # context. The finished tree is kept (below) for remove_feeds,
+        # so elements are not released as they close.
+        category_stack = []
+        # Open category elements, so each feed's parent is known on sight
+        elem_stack = []
+
+        # Bind the per-iteration lookups to locals once; with tens of
+        # thousands of outlines the repeated LOAD_ATTRs add up
+        feeds_append = self.feeds.append
+        url_index = self._url_index
+        parent_of = self._parent_of
+        self._categories = None
+
+        iterator = ET.iterparse(self._source(), events=('start', 'end'))
+        for event, elem in iterator:
+            if elem.tag != 'outline':
+                continue
+
+            get = elem.get
+            if event == 'start':
+                if get('type') == 'rss':
+                    current_category = category_stack[-1] if category_stack else None
+                    feed = Feed(
+                        title=get('title', ''),
+                        xml_url=get('xmlUrl', ''),
+                        html_url=get('htmlUrl', ''),
+                        category=current_category
+                    )
+                    feeds_append(feed)
+
+                    # Index under both keys remove_feeds matches on
+                    url_index[feed.title] = elem
+                    url_index[feed.xml_url] = elem
+                    # None marks a top-level feed; resolved to body below
+                    parent_of[elem] = elem_stack[-1] if elem_stack else None
+                else:
+                    # Interned so the hundreds of feeds sharing a category
+                    # point at one string object - less memory, and identity-
+                    # fast hashing in the categories dict and later grouping
+                    category_stack.append(sys.intern(get('text', '') or get('title', '')))
+                    elem_stack.append(elem)
+            else:
+                if get('type') != 'rss':
+                    category_stack.pop()
+                    elem_stack.pop()
+
+        # Keep the finished tree so remove_feeds doesn't re-parse the file
+        self._tree = ET.ElementTree(iterator.root)
+
+        body = iterator.root.find('body')
+        for elem, parent in parent_of.items():
+            if parent is None:
+                parent_of[elem] = body
+
         return self.feeds, self.categories
-    
-    def _parse_outline(self, outline, current_category=None):
-        for child in outline:
-            if child.get('type') == 'rss':
-                feed = Feed(
-                    title=child.get('title', ''),
-                    xml_url=child.get('xmlUrl', ''),
-                    html_url=child.get('htmlUrl', ''),
-                    category=current_category
-                )
-                self.feeds.append(feed)
-                
-                if current_category:
-                    if current_category not in self.categories:
-                        self.categories[current_category] = []
-                    self.categories[current_category].append(feed)
+
+    @property
+    def categories(self) -> Dict[str, List[Feed]]:
+        """Feeds grouped by category, built lazily from self.feeds.
+
+        Grouping used to happen inline in the parse loop with a dict
+        write per feed; deferring it to one tight pass here keeps the
+        hot loop lean, and feeds-only consumers never pay for it."""
+        if self._categories is None:
+            grouped = {}
+            for feed in self.feeds:
+                if feed.category:
+                    grouped.setdefault(feed.category, []).append(feed)
+            self._categories = grouped
+        return self._categories
+
+    def parse_soa(self) -> Dict[str, list]:
+        """Parse the OPML into parallel lists instead of Feed objects.
+
+        Returns {'titles', 'xml_urls', 'html_urls', 'categories'}, each a
+        list with one entry per feed in document order. Skipping the Feed
+        wrapper per row keeps allocations down and iteration tight for
+        callers that only scan one or two columns; parse() remains the
+        object-producing API."""
+        titles, xml_urls, html_urls, feed_categories = [], [], [], []
+        titles_append = titles.append
+        xml_urls_append = xml_urls.append
+        html_urls_append = html_urls.append
+        categories_append = feed_categories.append
+        category_stack = []
+
+        for event, elem in ET.iterparse(self._source(), events=('start', 'end')):
+            if elem.tag != 'outline':
+                continue
+
+            get = elem.get
+            if event == 'start':
+                if get('type') == 'rss':
+                    titles_append(get('title', ''))
+                    xml_urls_append(get('xmlUrl', ''))
+                    html_urls_append(get('htmlUrl', ''))
+                    categories_append(category_stack[-1] if category_stack else None)
+                else:
+                    category_stack.append(sys.intern(get('text', '') or get('title', '')))
             else:
-                category_name = child.get('text', '') or child.get('title', '')
-                self._parse_outline(child, category_name)
-    
+                if get('type') != 'rss':
+                    category_stack.pop()
+                elem.clear()
+
+        return {
+            'titles': titles,
+            'xml_urls': xml_urls,
+            'html_urls': html_urls,
+            'categories': feed_categories,
+        }
+
     def get_categories(self) -> List[str]:
         return sorted(self.categories.keys())
     
     def get_feeds_by_category(self, category: str) -> List[Feed]:
         return self.categories.get(category, [])
     
-    def remove_feeds(self, feeds_to_remove: Set[str], output_file: str = None):
-        """Remove specified feeds from OPML and save to a new file."""
-        tree = ET.parse(self.opml_file)
-        root = tree.getroot()
-        body = root.find('body')
-        
-        removed_count = 0
-        
-        def remove_from_outline(outline):
-            nonlocal removed_count
-            to_remove = []
-            
-            for child in outline:
-                if child.get('type') == 'rss':
-                    if child.get('title', '') in feeds_to_remove or child.get('xmlUrl', '') in feeds_to_remove:
-                        to_remove.append(child)
-                        removed_count += 1
-                else:
-                    remove_from_outline(child)
-            
-            for child in to_remove:
-                outline.remove(child)
-        
-        remove_from_outline(body)
+    def remove_feeds(self, feeds_to_remove: Set[str], output_file: str = None,
+                     mutate_in_place: bool = False, pretty: bool = True):
+        """Remove specified feeds from OPML and save to a new file.
+
+        Reuses the tree retained by parse() instead of re-parsing the
+        file; by default it works on a copy so the parser's tree stays
+        pristine for further calls. Pass pretty=False when the output is
+        machine-consumed to skip the indentation pass entirely."""
+        if mutate_in_place and self._tree is not None and self._url_index:
+            # The parse-time index points straight at the retained tree's
+            # elements, so removals are direct parent.remove calls -
+            # O(len(feeds_to_remove)) with no tree walk. A copied tree has
+            # different element objects, so this only applies in place.
+            tree = self._tree
+            doomed = {elem for elem in map(self._url_index.get, feeds_to_remove)
+                      if elem is not None}
+            for elem in doomed:
+                self._parent_of.pop(elem).remove(elem)
+                self._url_index.pop(elem.get('title', ''), None)
+                self._url_index.pop(elem.get('xmlUrl', ''), None)
+            removed_count = len(doomed)
+        else:
+            if self._tree is not None:
+                tree = deepcopy(self._tree)
+            else:
+                tree = ET.parse(self._source())
+            body = tree.getroot().find('body')
+
+            removed_count = 0
+
+            # Let the C-implemented iterator enumerate every outline up
+            # front instead of maintaining a Python-level stack; the list
+            # is materialized first so pruning children below can't
+            # disturb the traversal
+            for parent in [body, *body.iter('outline')]:
+                # Every feed leaf and empty category placeholder shows up
+                # as a candidate; nothing to prune under them
+                if not len(parent):
+                    continue
+                keep = []
+
+                for child in parent:
+                    if child.get('type') == 'rss':
+                        if child.get('title', '') in feeds_to_remove or child.get('xmlUrl', '') in feeds_to_remove:
+                            removed_count += 1
+                            continue
+                    keep.append(child)
+
+                # One slice assignment replaces the children in O(n); calling
+                # parent.remove(child) per hit rescans the child list each time
+                if len(keep) != len(parent):
+                    parent[:] = keep
         
         # Save to file
         if output_file is None:
             # Create backup filename with timestamp
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            output_file = self.opml_file.replace('.xml', f'_cleaned_{timestamp}.xml')
-        
-        # Pretty print the XML
-        ET.indent(tree, space='  ')
-        tree.write(output_file, encoding='UTF-8', xml_declaration=True)
+            output_file = self.opml_file.replace('.xml', f'_cleaned_{_timestamp()}.xml')
         
+        # Pretty print the XML; lxml does this during its C-level
+        # serialization, while the stdlib needs a separate indent pass
+        # that walks the whole tree mutating text/tail strings - the
+        # pretty flag lets callers drop that cost
+        if _HAVE_LXML:
+            tree.write(output_file, encoding='UTF-8', xml_declaration=True,
+                       pretty_print=pretty)
+        else:
+            if pretty:
+                ET.indent(tree, space='  ')
+            tree.write(output_file, encoding='UTF-8', xml_declaration=True)
+
         return output_file, removed_count
     
     @staticmethod
@@ -102,31 +286,36 @@ class OPMLParser:
         - Return the new filename
         """
         directory = os.path.dirname(source_file) or '.'
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = _timestamp()
         
-        # Pattern to match all_feeds_TIMESTAMP.xml
-        pattern = re.compile(r'^all_feeds_(\d{8}_\d{6})\.xml$')
-        
-        # Find existing all_feeds file
+        # Find existing all_feeds file; _extract_feed_ts validates the name
+        # with slice checks, and scandir's cached stat info avoids a
+        # syscall per entry
         existing_all_feeds = None
-        for file in os.listdir(directory):
-            if pattern.match(file):
-                existing_all_feeds = os.path.join(directory, file)
+        old_timestamp = None
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                ts = _extract_feed_ts(entry.name)
+                if ts is None:
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                existing_all_feeds = entry.path
+                old_timestamp = ts
                 break
-        
-        # Archive existing all_feeds if it exists
+
+        # Archive existing all_feeds if it exists; both paths are in the
+        # same directory, so os.replace is one atomic rename with no risk
+        # of shutil.move's copy+delete fallback
         if existing_all_feeds:
-            # Extract timestamp from filename
-            match = pattern.match(os.path.basename(existing_all_feeds))
-            if match:
-                old_timestamp = match.group(1)
-                archive_name = os.path.join(directory, f'archived_feeds_{old_timestamp}.xml')
-                shutil.move(existing_all_feeds, archive_name)
-                print(f"Archived existing feed file to: {archive_name}")
-        
-        # Create new all_feeds file
+            archive_name = os.path.join(directory, f'archived_feeds_{old_timestamp}.xml')
+            os.replace(existing_all_feeds, archive_name)
+            print(f"Archived existing feed file to: {archive_name}")
+
+        # Create new all_feeds file; copyfile skips copy2's extra stat and
+        # metadata pass - the new file gets its own timestamps anyway
         new_filename = os.path.join(directory, f'all_feeds_{timestamp}.xml')
-        shutil.copy2(source_file, new_filename)
+        shutil.copyfile(source_file, new_filename)
         print(f"Created new main feed file: {new_filename}")
         
         return new_filename
@@ -134,18 +323,17 @@ class OPMLParser:
     @staticmethod
     def get_current_feeds_file(directory: str = '.') -> Optional[str]:
         """Find the current all_feeds_TIMESTAMP.xml file."""
-        pattern = re.compile(r'^all_feeds_(\d{8}_\d{6})\.xml$')
-        
-        feed_files = []
-        for file in os.listdir(directory):
-            match = pattern.match(file)
-            if match:
-                timestamp = match.group(1)
-                feed_files.append((timestamp, os.path.join(directory, file)))
-        
-        if feed_files:
-            # Sort by timestamp and return the newest
-            feed_files.sort(reverse=True)
-            return feed_files[0][1]
-        
-        return None
\ No newline at end of file
+        # Track the newest match in a single pass; no list to build or sort
+        best_ts = ''
+        best_path = None
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                ts = _extract_feed_ts(entry.name)
+                if ts is None:
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if ts > best_ts:
+                    best_ts, best_path = ts, entry.path
+
+        return best_path
\ No newline at end of file
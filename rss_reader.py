@@ -2,24 +2,29 @@
 
 import click
 from rich.console import Console
-from rich.text import Text
-from rich.prompt import Confirm
 from datetime import datetime
+import io
 import os
 import re
 from opml_parser import OPMLParser
 from feed_parser import FeedParser
 from typing import Optional, List
 from difflib import get_close_matches
+from functools import lru_cache
 try:
-    from gemini_summarizer import GeminiSummarizer
-    GEMINI_AVAILABLE = True
+    from rapidfuzz import fuzz, process as fuzz_process
+    from rapidfuzz.utils import default_process as fuzz_preprocess
+    RAPIDFUZZ_AVAILABLE = True
 except ImportError:
-    GEMINI_AVAILABLE = False
+    RAPIDFUZZ_AVAILABLE = False
 
 
 console = Console()
 
+# Compiled once for the summary-filename sanitizer instead of per save
+_SAFE_CHARS_RE = re.compile(r'[^\w\s-]')
+_DASH_RUN_RE = re.compile(r'[-\s]+')
+
 
 def find_opml_file():
     # First, look for all_feeds_TIMESTAMP.xml
@@ -34,22 +39,59 @@ def find_opml_file():
     return None
 
 
+@lru_cache(maxsize=8)
+def _lowered(strings: tuple) -> tuple:
+    """Lowercased copies of a candidate tuple.
+
+    The fuzzy finders get called several times per CLI run with the
+    same category/title lists; caching the lowered forms means each
+    string is lowercased once per invocation instead of once per
+    comparison pass."""
+    return tuple(s.lower() for s in strings)
+
+
+@lru_cache(maxsize=8)
+def _lower_index(strings: tuple) -> dict:
+    """Map each lowered candidate to its position in the tuple.
+
+    Gives the fuzzy finders an O(1) exact-match check before they fall
+    back to scanning; first occurrence wins on duplicates, matching the
+    old first-hit loop behavior."""
+    index = {}
+    for i, lower in enumerate(_lowered(strings)):
+        index.setdefault(lower, i)
+    return index
+
+
+def suggest_matches(search_term: str, candidates: List[str], n: int = 3) -> List[str]:
+    """Find near-miss suggestions for a search term.
+
+    Uses RapidFuzz's C++ scorer when available (much faster than difflib
+    on hundreds of candidates); falls back to difflib otherwise."""
+    if RAPIDFUZZ_AVAILABLE:
+        hits = fuzz_process.extract(search_term, candidates, scorer=fuzz.WRatio,
+                                    processor=fuzz_preprocess, limit=n, score_cutoff=40)
+        return [candidate for candidate, _, _ in hits]
+    return get_close_matches(search_term, candidates, n=n, cutoff=0.4)
+
+
 def fuzzy_find_category(search_term: str, categories: List[str]) -> Optional[str]:
     """Find category using fuzzy matching."""
     if not search_term:
         return None
     
     search_lower = search_term.lower()
-    
-    # First, try exact match (case-insensitive)
-    for cat in categories:
-        if search_lower == cat.lower():
-            return cat
-    
+    candidates = tuple(categories)
+    lowered = _lowered(candidates)
+
+    # First, try exact match (case-insensitive) - one dict lookup, no scan
+    exact = _lower_index(candidates).get(search_lower)
+    if exact is not None:
+        return categories[exact]
+
     # Try partial matches - category contains search term
     matches = []
-    for cat in categories:
-        cat_lower = cat.lower()
+    for cat, cat_lower in zip(categories, lowered):
         # Check if search term is in category name
         if search_lower in cat_lower:
             matches.append(cat)
@@ -71,11 +113,15 @@ def fuzzy_find_category(search_term: str, categories: List[str]) -> Optional[str
         # Otherwise return the first match
         return matches[0]
     
-    # Try fuzzy matching with difflib
+    # Try fuzzy matching
+    if RAPIDFUZZ_AVAILABLE:
+        best = fuzz_process.extractOne(search_term, categories, scorer=fuzz.WRatio,
+                                       processor=fuzz_preprocess, score_cutoff=60)
+        return best[0] if best else None
     close_matches = get_close_matches(search_term, categories, n=1, cutoff=0.6)
     if close_matches:
         return close_matches[0]
-    
+
     return None
 
 
@@ -85,58 +131,85 @@ def fuzzy_find_feed(search_term: str, feeds: List) -> List:
         return []
     
     search_lower = search_term.lower()
+    feed_titles = tuple(f.title for f in feeds)
+    lowered = _lowered(feed_titles)
     matches = []
-    
-    # First try exact matches
-    for feed in feeds:
-        if search_lower == feed.title.lower():
-            return [feed]
-    
+
+    # First try exact matches - one dict lookup, no scan
+    exact = _lower_index(feed_titles).get(search_lower)
+    if exact is not None:
+        return [feeds[exact]]
+
     # Then try partial matches
-    for feed in feeds:
-        if search_lower in feed.title.lower():
+    for feed, title_lower in zip(feeds, lowered):
+        if search_lower in title_lower:
             matches.append(feed)
-    
+
     if matches:
         return matches
-    
+
     # Try fuzzy matching
-    feed_titles = [f.title for f in feeds]
+    if RAPIDFUZZ_AVAILABLE:
+        by_title = {f.title: f for f in feeds}
+        hits = fuzz_process.extract(search_term, feed_titles, scorer=fuzz.WRatio,
+                                    processor=fuzz_preprocess, limit=5, score_cutoff=60)
+        return [by_title[title] for title, _, _ in hits]
     close_matches = get_close_matches(search_term, feed_titles, n=5, cutoff=0.6)
-    
-    return [f for f in feeds if f.title in close_matches]
+    matched = set(close_matches)
+
+    return [f for f in feeds if f.title in matched]
 
 
 def get_article_counts_for_feeds(feeds, feed_parser):
     """Get article counts for a list of feeds using parallel fetching."""
-    from concurrent.futures import ThreadPoolExecutor, as_completed
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
     from rich.progress import Progress, SpinnerColumn, TextColumn
-    
+
     counts = {}
-    
-    def count_feed_articles(feed):
-        articles = feed_parser.fetch_feed(feed.xml_url, feed.title, feed.category)
-        return feed.title, len(articles)
-    
+    if not feeds:
+        return counts
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         transient=True,
     ) as progress:
         task = progress.add_task(f"Counting articles in {len(feeds)} feeds...", total=len(feeds))
-        
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            future_to_feed = {executor.submit(count_feed_articles, feed): feed for feed in feeds}
-            
-            for future in as_completed(future_to_feed):
-                try:
-                    feed_title, count = future.result()
-                    counts[feed_title] = count
-                except Exception as e:
-                    feed = future_to_feed[future]
-                    counts[feed.title] = 0
-                progress.advance(task)
-    
+
+        # Each future records its own result through a done-callback, so
+        # there's no as_completed generator or future->feed dict to walk
+        # on the main thread - it just waits for the last callback.
+        # Advances are batched: every bar update costs a Rich re-render,
+        # so flush every 10 completions (and at the end) instead
+        done = threading.Event()
+        lock = threading.Lock()
+        state = {'remaining': len(feeds), 'pending': 0}
+
+        def record(future, feed):
+            try:
+                counts[feed.title] = future.result()
+            except Exception:
+                counts[feed.title] = 0
+            with lock:
+                state['pending'] += 1
+                state['remaining'] -= 1
+                finished = state['remaining'] == 0
+                if finished or state['pending'] >= 10:
+                    progress.advance(task, state['pending'])
+                    state['pending'] = 0
+            if finished:
+                done.set()
+
+        # Size the pool to the work: no idle threads for small feed
+        # lists, capped at the session's connection-pool size
+        with ThreadPoolExecutor(max_workers=min(20, max(1, len(feeds)))) as executor:
+            for feed in feeds:
+                future = executor.submit(feed_parser.count_articles_24h,
+                                         feed.xml_url, feed.title, feed.category)
+                future.add_done_callback(lambda fut, feed=feed: record(fut, feed))
+            done.wait()
+
     return counts
 
 
@@ -163,8 +236,8 @@ def generate_and_save_summary(articles, source_name, summarizer):
         # Create filename with date and title
         date_str = datetime.now().strftime('%Y-%m-%d')
         # Sanitize title for filename
-        safe_title = re.sub(r'[^\w\s-]', '', generated_title)
-        safe_title = re.sub(r'[-\s]+', '-', safe_title)
+        safe_title = _SAFE_CHARS_RE.sub('', generated_title)
+        safe_title = _DASH_RUN_RE.sub('-', safe_title)
         
         # Only use the title in the filename, no source names
         filename = f"{date_str} {safe_title}.md"
@@ -189,53 +262,59 @@ def generate_and_save_summary(articles, source_name, summarizer):
             os.makedirs(obsidian_folder, exist_ok=True)
         
         filepath = os.path.join(obsidian_folder, filename)
+
+        # Assemble the whole document in memory and write it with one
+        # call - the old per-line f.write pattern paid a lock and buffer
+        # pass for every article bullet
+        buf = io.StringIO()
+        buf.write(f"# {generated_title}\n\n")
+        buf.write(f"Source: {source_name}\n")
+        buf.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
+        buf.write(f"Generated from {len(articles)} articles\n")
+        buf.write(f"Input tokens: {total_tokens:,}\n")
         
+        # Calculate output tokens and costs
+        output_tokens = len(summary.split()) * 1.34  # Estimate output tokens
+
+        # Get pricing based on model
+        if 'flash-lite' in summarizer.model_name.lower():
+            input_price = 0.10
+            output_price = 0.40
+            model_display = "Gemini 2.5 Flash-Lite"
+        elif 'flash' in summarizer.model_name.lower():
+            input_price = 0.30
+            output_price = 2.50
+            model_display = "Gemini 2.5 Flash"
+        else:
+            input_price = 1.25
+            output_price = 10.00
+            model_display = "Gemini 2.5 Pro"
+
+        input_cost = (total_tokens / 1_000_000) * input_price
+        output_cost = (output_tokens / 1_000_000) * output_price
+        total_cost = input_cost + output_cost
+
+        buf.write(f"Output tokens: ~{int(output_tokens):,}\n")
+        buf.write(f"Model: {model_display}\n")
+        buf.write(f"Estimated cost: ${total_cost:.6f} (input: ${input_cost:.6f}, output: ${output_cost:.6f})\n")
+        buf.write("\n---\n\n")
+        buf.write(summary)
+        buf.write("\n\n---\n\n")
+        buf.write("## Appendix: Full Article List\n\n")
+
+        # Append all articles with their details
+        for i, article in enumerate(articles, 1):
+            buf.write(f"### {i}. {article.title}\n")
+            buf.write(f"- **Source:** {article.feed_title}\n")
+            buf.write(f"- **Category:** {article.category}\n")
+            buf.write(f"- **Published:** {article.published.strftime('%Y-%m-%d %H:%M')}\n")
+            buf.write(f"- **URL:** {article.link}\n")
+            if article.summary:
+                buf.write(f"- **Summary:** {article.summary}\n")
+            buf.write("\n")
+
         with open(filepath, 'w') as f:
-            f.write(f"# {generated_title}\n\n")
-            f.write(f"Source: {source_name}\n")
-            f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
-            f.write(f"Generated from {len(articles)} articles\n")
-            f.write(f"Input tokens: {total_tokens:,}\n")
-            
-            # Calculate output tokens and costs
-            output_tokens = len(summary.split()) * 1.34  # Estimate output tokens
-            
-            # Get pricing based on model
-            if 'flash-lite' in summarizer.model_name.lower():
-                input_price = 0.10
-                output_price = 0.40
-                model_display = "Gemini 2.5 Flash-Lite"
-            elif 'flash' in summarizer.model_name.lower():
-                input_price = 0.30
-                output_price = 2.50
-                model_display = "Gemini 2.5 Flash"
-            else:
-                input_price = 1.25
-                output_price = 10.00
-                model_display = "Gemini 2.5 Pro"
-            
-            input_cost = (total_tokens / 1_000_000) * input_price
-            output_cost = (output_tokens / 1_000_000) * output_price
-            total_cost = input_cost + output_cost
-            
-            f.write(f"Output tokens: ~{int(output_tokens):,}\n")
-            f.write(f"Model: {model_display}\n")
-            f.write(f"Estimated cost: ${total_cost:.6f} (input: ${input_cost:.6f}, output: ${output_cost:.6f})\n")
-            f.write("\n---\n\n")
-            f.write(summary)
-            f.write("\n\n---\n\n")
-            f.write("## Appendix: Full Article List\n\n")
-            
-            # Append all articles with their details
-            for i, article in enumerate(articles, 1):
-                f.write(f"### {i}. {article.title}\n")
-                f.write(f"- **Source:** {article.feed_title}\n")
-                f.write(f"- **Category:** {article.category}\n")
-                f.write(f"- **Published:** {article.published.strftime('%Y-%m-%d %H:%M')}\n")
-                f.write(f"- **URL:** {article.link}\n")
-                if article.summary:
-                    f.write(f"- **Summary:** {article.summary}\n")
-                f.write("\n")
+            f.write(buf.getvalue())
         
         console.print(f"\n[green]✓ Summary automatically saved to: {filename}[/green]")
         console.print(f"[dim]Full path: {filepath}[/dim]")
@@ -251,18 +330,24 @@ def display_articles(articles, show_summary=True):
         return
     
     console.print(f"\n[bold]Found {len(articles)} articles from the last 24 hours[/bold]\n")
-    
+
+    # Accumulate everything and print once: each console.print pays for
+    # markup parsing, styling and a flush, which adds up at 4-5 calls
+    # per article across hundreds of articles
+    lines = []
     for article in articles:
         time_str = article.published.strftime("%Y-%m-%d %H:%M")
-        
-        console.print(f"[dim]{time_str}[/dim] | [cyan]{article.category}[/cyan] | [green]{article.feed_title}[/green]")
-        console.print(f"  [bold white]{article.title}[/bold white]")
-        console.print(f"  [blue][link={article.link}]{article.link}[/link][/blue]")
-        
+
+        lines.append(f"[dim]{time_str}[/dim] | [cyan]{article.category}[/cyan] | [green]{article.feed_title}[/green]")
+        lines.append(f"  [bold white]{article.title}[/bold white]")
+        lines.append(f"  [blue][link={article.link}]{article.link}[/link][/blue]")
+
         if show_summary and article.summary:
-            console.print(f"  [dim]{article.summary}[/dim]")
-        
-        console.print()  # Empty line between articles
+            lines.append(f"  [dim]{article.summary}[/dim]")
+
+        lines.append("")  # Empty line between articles
+
+    console.print("\n".join(lines))
 
 
 @click.command()
@@ -310,35 +395,43 @@ def main(category, feed, list_categories, list_feeds, show_counts, health_check,
     
     parser = OPMLParser(opml_file)
     all_feeds, categories_dict = parser.parse()
+
+    # One parser instance for every branch below, so they all share the
+    # same HTTP session, connection pool and on-disk cache
+    feed_parser = FeedParser()
+    
+    # Sorted category names, computed once; every branch below reads it
+    all_category_names = parser.get_categories()
     
     if list_categories:
         console.print("\n[bold]Available Categories:[/bold]\n")
         
         if show_counts:
             # Show categories with article counts
-            feed_parser = FeedParser()
-            
             console.print("[dim]Counting articles across all categories...[/dim]\n")
             
             # Get counts for all feeds in parallel
             all_feed_counts = get_article_counts_for_feeds(all_feeds, feed_parser)
             
-            # Aggregate by category
-            category_counts = {}
-            for cat in parser.get_categories():
-                cat_feeds = categories_dict.get(cat, [])
-                total_articles = sum(all_feed_counts.get(feed.title, 0) for feed in cat_feeds)
-                category_counts[cat] = (len(cat_feeds), total_articles)
-            
-            for cat in parser.get_categories():
-                feed_count, article_count = category_counts[cat]
+            # Aggregate by category in one linear scan over the feeds
+            # instead of a per-category generator over categories_dict
+            from collections import Counter
+            article_totals = Counter()
+            feed_totals = Counter()
+            for feed in all_feeds:
+                if feed.category:
+                    article_totals[feed.category] += all_feed_counts.get(feed.title, 0)
+                    feed_totals[feed.category] += 1
+
+            for cat in all_category_names:
+                feed_count, article_count = feed_totals[cat], article_totals[cat]
                 if article_count > 0:
                     console.print(f"  • {cat} ({feed_count} feeds, [bold green]{article_count} articles[/bold green])")
                 else:
                     console.print(f"  • {cat} ({feed_count} feeds, [dim]no articles[/dim])")
         else:
             # Show categories without counts (faster)
-            for cat in parser.get_categories():
+            for cat in all_category_names:
                 feed_count = len(categories_dict.get(cat, []))
                 console.print(f"  • {cat} ({feed_count} feeds)")
         return
@@ -349,10 +442,10 @@ def main(category, feed, list_categories, list_feeds, show_counts, health_check,
             feeds = []
             category_names = []
             for cat in category:
-                matched_category = fuzzy_find_category(cat, parser.get_categories())
+                matched_category = fuzzy_find_category(cat, all_category_names)
                 if not matched_category:
                     console.print(f"[red]Category '{cat}' not found.[/red]")
-                    suggestions = get_close_matches(cat, parser.get_categories(), n=3, cutoff=0.4)
+                    suggestions = suggest_matches(cat, all_category_names)
                     if suggestions:
                         console.print("[yellow]Did you mean one of these?[/yellow]")
                         for s in suggestions:
@@ -379,30 +472,33 @@ def main(category, feed, list_categories, list_feeds, show_counts, health_check,
             feeds = all_feeds
             console.print(f"\n[bold]All Feeds ({len(feeds)} total):[/bold]\n")
         
+        # Build every display line first and print once - a console.print
+        # per feed means a markup parse and flush per line
         if show_counts:
             # Show feeds with article counts
-            feed_parser = FeedParser()
             feed_counts = get_article_counts_for_feeds(feeds, feed_parser)
-            
+
+            lines = []
             for feed in feeds:
                 cat_str = f" [{feed.category}]" if feed.category else ""
                 article_count = feed_counts.get(feed.title, 0)
                 if article_count > 0:
-                    console.print(f"  • {feed.title}{cat_str} ([bold green]{article_count} articles[/bold green])")
+                    lines.append(f"  • {feed.title}{cat_str} ([bold green]{article_count} articles[/bold green])")
                 else:
-                    console.print(f"  • {feed.title}{cat_str} ([dim]no articles[/dim])")
+                    lines.append(f"  • {feed.title}{cat_str} ([dim]no articles[/dim])")
         else:
             # Show feeds without counts (faster)
-            for feed in feeds:
-                cat_str = f" [{feed.category}]" if feed.category else ""
-                console.print(f"  • {feed.title}{cat_str}")
+            lines = [
+                f"  • {feed.title} [{feed.category}]" if feed.category else f"  • {feed.title}"
+                for feed in feeds
+            ]
+        console.print("\n".join(lines))
         return
     
     if health_check:
         console.print("\n[bold]Feed Health Check[/bold]\n")
         console.print("[dim]Checking all feeds for issues...[/dim]\n")
-        
-        feed_parser = FeedParser()
+
         problem_feeds = []
         healthy_feeds = []
         
@@ -420,19 +516,25 @@ def main(category, feed, list_categories, list_feeds, show_counts, health_check,
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         ) as progress:
             task = progress.add_task(f"Checking {len(all_feeds)} feeds...", total=len(all_feeds))
-            
-            with ThreadPoolExecutor(max_workers=20) as executor:
+
+            with ThreadPoolExecutor(max_workers=min(20, max(1, len(all_feeds)))) as executor:
                 future_to_feed = {executor.submit(check_feed, feed): feed for feed in all_feeds}
                 
+                # Batch bar updates - one re-render per 10 results
+                pending = 0
                 for future in as_completed(future_to_feed):
                     feed, is_healthy, error_msg, article_count, suggested_fix = future.result()
-                    
+
                     if is_healthy:
                         healthy_feeds.append((feed, article_count))
                     else:
                         problem_feeds.append((feed, error_msg, suggested_fix))
-                    
-                    progress.advance(task)
+
+                    pending += 1
+                    if pending >= 10:
+                        progress.advance(task, pending)
+                        pending = 0
+                progress.advance(task, pending)
         
         # Display results
         console.print(f"\n[bold green]Healthy feeds: {len(healthy_feeds)}[/bold green]")
@@ -441,18 +543,14 @@ def main(category, feed, list_categories, list_feeds, show_counts, health_check,
         if problem_feeds:
             console.print("[bold]Problem Feeds:[/bold]\n")
             
-            # Group by error type
-            error_groups = {}
-            fixable_feeds = []
-            
+            # Group by error type; defaultdict avoids the membership
+            # check + second hash per insert
+            from collections import defaultdict
+            error_groups = defaultdict(list)
             for feed, error, suggested_fix in problem_feeds:
-                error_type = error.split(':')[0]
-                if error_type not in error_groups:
-                    error_groups[error_type] = []
-                error_groups[error_type].append((feed, error, suggested_fix))
-                
-                if suggested_fix:
-                    fixable_feeds.append((feed, suggested_fix))
+                error_groups[error.split(':', 1)[0]].append((feed, error, suggested_fix))
+
+            fixable_feeds = [(feed, fix) for feed, _, fix in problem_feeds if fix]
             
             for error_type, feeds in sorted(error_groups.items()):
                 console.print(f"\n[yellow]{error_type}:[/yellow] ({len(feeds)} feeds)")
@@ -470,8 +568,15 @@ def main(category, feed, list_categories, list_feeds, show_counts, health_check,
                 
                 if fix_urls:
                     console.print(f"\n[bold]Applying URL fixes...[/bold]")
-                    import xml.etree.ElementTree as ET
-                    
+                    # Same lxml-with-stdlib-fallback arrangement as
+                    # opml_parser: C-level parse, iterate and serialize
+                    try:
+                        from lxml import etree as ET
+                        have_lxml = True
+                    except ImportError:
+                        import xml.etree.ElementTree as ET
+                        have_lxml = False
+
                     # Create a mapping of old URLs to new URLs
                     url_fixes = {feed.xml_url: fix for feed, fix in fixable_feeds}
                     
@@ -481,27 +586,27 @@ def main(category, feed, list_categories, list_feeds, show_counts, health_check,
                     body = root.find('body')
                     
                     fixed_count = 0
-                    
-                    def fix_outline_urls(outline):
-                        nonlocal fixed_count
-                        for child in outline:
-                            if child.get('type') == 'rss':
-                                xml_url = child.get('xmlUrl', '')
-                                if xml_url in url_fixes:
-                                    child.set('xmlUrl', url_fixes[xml_url])
-                                    fixed_count += 1
-                                    console.print(f"  [green]✓[/green] Fixed: {child.get('title', 'Unknown')}")
-                            else:
-                                fix_outline_urls(child)
-                    
-                    fix_outline_urls(body)
+
+                    # One C-level walk over every outline instead of
+                    # Python-level recursion per category
+                    for el in body.iter('outline'):
+                        if el.get('type') == 'rss':
+                            xml_url = el.get('xmlUrl', '')
+                            if xml_url in url_fixes:
+                                el.set('xmlUrl', url_fixes[xml_url])
+                                fixed_count += 1
+                                console.print(f"  [green]✓[/green] Fixed: {el.get('title', 'Unknown')}")
                     
                     if fixed_count > 0:
                         # Save updated OPML to temporary file
                         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                         temp_file = opml_file.replace('.xml', f'_temp_fixed_{timestamp}.xml')
-                        ET.indent(tree, space='  ')
-                        tree.write(temp_file, encoding='UTF-8', xml_declaration=True)
+                        if have_lxml:
+                            tree.write(temp_file, encoding='UTF-8', xml_declaration=True,
+                                       pretty_print=True)
+                        else:
+                            ET.indent(tree, space='  ')
+                            tree.write(temp_file, encoding='UTF-8', xml_declaration=True)
                         
                         # Use manage_feed_files to properly organize it
                         new_file = OPMLParser.manage_feed_files(temp_file)
@@ -514,39 +619,40 @@ def main(category, feed, list_categories, list_feeds, show_counts, health_check,
                         console.print("[yellow]No URLs were fixed[/yellow]")
             
             if export_health:
-                # Export health check results
+                # Export health check results, streaming one record at a
+                # time instead of materializing a dict per feed up front
                 import json
                 import csv
-                
-                export_data = []
-                
-                # Add healthy feeds
-                for feed, article_count in healthy_feeds:
-                    export_data.append({
-                        'title': feed.title,
-                        'url': feed.xml_url,
-                        'category': feed.category or '',
-                        'status': 'healthy',
-                        'error': '',
-                        'article_count': article_count,
-                        'suggested_fix': ''
-                    })
-                
-                # Add problem feeds
-                for feed, error, suggested_fix in problem_feeds:
-                    export_data.append({
-                        'title': feed.title,
-                        'url': feed.xml_url,
-                        'category': feed.category or '',
-                        'status': 'error',
-                        'error': error,
-                        'article_count': 0,
-                        'suggested_fix': suggested_fix or ''
-                    })
-                
+
+                def export_rows():
+                    for feed, article_count in healthy_feeds:
+                        yield {
+                            'title': feed.title,
+                            'url': feed.xml_url,
+                            'category': feed.category or '',
+                            'status': 'healthy',
+                            'error': '',
+                            'article_count': article_count,
+                            'suggested_fix': ''
+                        }
+                    for feed, error, suggested_fix in problem_feeds:
+                        yield {
+                            'title': feed.title,
+                            'url': feed.xml_url,
+                            'category': feed.category or '',
+                            'status': 'error',
+                            'error': error,
+                            'article_count': 0,
+                            'suggested_fix': suggested_fix or ''
+                        }
+
                 if export_health.lower().endswith('.json'):
                     with open(export_health, 'w') as f:
-                        json.dump(export_data, f, indent=2)
+                        f.write('[')
+                        for i, row in enumerate(export_rows()):
+                            f.write(',\n  ' if i else '\n  ')
+                            f.write(json.dumps(row))
+                        f.write('\n]')
                     console.print(f"\n[green]✓ Health check results exported to: {export_health}[/green]")
                 else:
                     # Default to CSV
@@ -554,7 +660,8 @@ def main(category, feed, list_categories, list_feeds, show_counts, health_check,
                     with open(csv_file, 'w', newline='') as f:
                         writer = csv.DictWriter(f, fieldnames=['title', 'url', 'category', 'status', 'error', 'article_count', 'suggested_fix'])
                         writer.writeheader()
-                        writer.writerows(export_data)
+                        for row in export_rows():
+                            writer.writerow(row)
                     console.print(f"\n[green]✓ Health check results exported to: {csv_file}[/green]")
             
             if remove_defunct:
@@ -574,20 +681,19 @@ def main(category, feed, list_categories, list_feeds, show_counts, health_check,
             console.print("[green]All feeds are healthy![/green]")
         
         return
-    
-    feed_parser = FeedParser()
-    
-    # Collect feeds from all specified categories and feeds
-    feeds_to_fetch = set()  # Use set to avoid duplicates
+
+    # Collect feeds from all specified categories and feeds; keyed by
+    # xml_url to avoid duplicates (Feed objects pass through as-is)
+    feeds_to_fetch = {}
     feed_sources = []  # Track sources for display
     
     # Process categories
     if category:
         for cat in category:
-            matched_category = fuzzy_find_category(cat, parser.get_categories())
+            matched_category = fuzzy_find_category(cat, all_category_names)
             if not matched_category:
                 console.print(f"[red]Category '{cat}' not found.[/red]")
-                suggestions = get_close_matches(cat, parser.get_categories(), n=3, cutoff=0.4)
+                suggestions = suggest_matches(cat, all_category_names)
                 if suggestions:
                     console.print("[yellow]Did you mean one of these?[/yellow]")
                     for s in suggestions:
@@ -599,7 +705,7 @@ def main(category, feed, list_categories, list_feeds, show_counts, health_check,
             
             category_feeds = parser.get_feeds_by_category(matched_category)
             for f in category_feeds:
-                feeds_to_fetch.add((f.xml_url, f.title, f.category))
+                feeds_to_fetch.setdefault(f.xml_url, f)
             feed_sources.append(('category', matched_category))
     
     # Process individual feeds
@@ -611,7 +717,7 @@ def main(category, feed, list_categories, list_feeds, show_counts, health_check,
                 continue
             
             for mf in matched_feeds:
-                feeds_to_fetch.add((mf.xml_url, mf.title, mf.category))
+                feeds_to_fetch.setdefault(mf.xml_url, mf)
             
             if len(matched_feeds) > 1:
                 console.print(f"[yellow]Found {len(matched_feeds)} feeds matching '{f}'[/yellow]")
@@ -619,10 +725,10 @@ def main(category, feed, list_categories, list_feeds, show_counts, health_check,
     
     # If no categories or feeds specified, use all
     if not category and not feed:
-        feeds_to_fetch = [(f.xml_url, f.title, f.category) for f in all_feeds]
+        feeds_to_fetch = all_feeds
         feed_sources.append(('all', 'All Feeds'))
-    
-    feeds_to_fetch = list(feeds_to_fetch)  # Convert back to list
+    else:
+        feeds_to_fetch = list(feeds_to_fetch.values())
     
     if not feeds_to_fetch:
         console.print("[red]No feeds to fetch.[/red]")
@@ -642,11 +748,15 @@ def main(category, feed, list_categories, list_feeds, show_counts, health_check,
         
         # Handle AI summarization if requested
         if summarize:
-            if not GEMINI_AVAILABLE:
+            # Imported here so the google-genai stack (grpc, protobuf,
+            # auth) never loads for the listing and fetch paths
+            try:
+                from gemini_summarizer import GeminiSummarizer
+            except ImportError:
                 console.print("\n[red]Error: google-genai package not installed.[/red]")
                 console.print("Install it with: pip install google-genai")
                 return
-                
+
             try:
                 summarizer = GeminiSummarizer()
                 